@@ -9,8 +9,19 @@ tune without code changes. Units are noted in each docstring.
 
 from __future__ import annotations
 from dataclasses import dataclass
+import math
 import numpy as np
 
+try:
+    from numba import vectorize
+except ImportError:
+    vectorize = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
 from .config import gas as GAS, icbc as ICBC
 
 # Physical constants
@@ -44,55 +55,87 @@ class ClosureParams:
 params = ClosureParams()
 
 
+_LN2 = math.log(2.0)
+_INV_LN2 = 1.0 / _LN2
+
+
+def _exp_neg_scalar(x: float) -> float:
+    """
+    e^{-x} via range reduction -x = n ln2 + r, |r| <= ln2/2, a degree-7
+    polynomial for e^r (rel. error < 1e-8) and ldexp for the 2^n factor.
+    Intended for x in the clipped closure range [-100, 100].
+    """
+    y = -x
+    n = math.floor(y * _INV_LN2 + 0.5)
+    r = y - n * _LN2
+    p = 1.0 / 5040.0
+    p = p * r + 1.0 / 720.0
+    p = p * r + 1.0 / 120.0
+    p = p * r + 1.0 / 24.0
+    p = p * r + 1.0 / 6.0
+    p = p * r + 0.5
+    p = p * r + 1.0
+    p = p * r + 1.0
+    return math.ldexp(p, int(n))
+
+
+if vectorize is not None:
+    fast_exp_neg = vectorize(["f8(f8)"], fastmath=True, cache=True)(_exp_neg_scalar)
+elif numexpr is not None:
+    def fast_exp_neg(x):
+        """Vectorized e^{-x} (numexpr VML-style exp)."""
+        return numexpr.evaluate("exp(-x)", local_dict={"x": np.asarray(x, dtype=float)})
+else:
+    def fast_exp_neg(x):
+        """Vectorized e^{-x}."""
+        return np.exp(-np.asarray(x, dtype=float))
+
+
 def nu_c_Hz(p_Torr: float, Tgas_K: float):
-    """Vectorized collision frequency [Hz]."""
-    import numpy as _np
+    """Collision frequency [Hz] for scalar (p, Tgas); shared by the vectorized closures."""
     p_Pa = p_Torr * 133.322368  # scalar
     T = max(Tgas_K, 1.0)        # scalar
     return params.nu0_HzPa * p_Pa / T
 
 def sigma_Spm(ne_m3, Te_eV, p_Torr: float, Tgas_K: float):
     """Vectorized Ohmic conductivity σ = e^2 ne / (me νc)."""
-    import numpy as _np
-    ne = _np.asarray(ne_m3, dtype=float)
+    ne = np.asarray(ne_m3, dtype=float)
     nu = nu_c_Hz(p_Torr, Tgas_K)  # scalar
-    return (e * e * _np.maximum(ne, 0.0)) / (me * max(nu, 1.0))
+    return (e * e * np.maximum(ne, 0.0)) / (me * max(nu, 1.0))
 
 def sigma_uniform_equiv(ne_avg, Te_avg):
     """Uniform effective σ̄ from average (ne,Te). Accepts scalars/arrays; uses means."""
-    import numpy as _np
-    ne = float(_np.mean(ne_avg))
-    Te = float(_np.mean(Te_avg))
+    ne = float(np.mean(ne_avg))
+    Te = float(np.mean(Te_avg))
     return sigma_Spm(ne, Te, GAS.p_Torr, GAS.Tgas_K)
 
 def Da_m2ps(Te_eV, p_Torr: float):
     """Vectorized ambipolar diffusion Da ~ Te / p."""
-    import numpy as _np
-    Te = _np.asarray(Te_eV, dtype=float)
-    return params.Da0_m2ps_per_eV_over_Torr * _np.maximum(Te, 0.01) / max(p_Torr, 0.1)
+    Te = np.asarray(Te_eV, dtype=float)
+    return params.Da0_m2ps_per_eV_over_Torr * np.maximum(Te, 0.01) / max(p_Torr, 0.1)
 
 def S_ion_Hz(E_eff_Vpm, p_Torr: float):
     """Vectorized Townsend-like ionization coefficient (per ne)."""
-    import numpy as _np
-    E = _np.asarray(E_eff_Vpm, dtype=float)
-    denom = _np.maximum(_np.abs(E), 1.0)
-    x = params.Ethr_over_Vpm_per_Torr * p_Torr / denom
-    x = _np.clip(x, -100.0, 100.0)
-    return params.alpha0_1ps_per_Torr * p_Torr * _np.exp(-x)
+    E = np.asarray(E_eff_Vpm, dtype=float)
+    # x = Ethr p / max(|E|, 1), built in one buffer
+    x = np.abs(E, out=np.empty_like(E))
+    np.maximum(x, 1.0, out=x)
+    np.divide(params.Ethr_over_Vpm_per_Torr * p_Torr, x, out=x)
+    # x >= 0 (p >= 0, denominator >= 1), so only the upper bound needs clipping
+    np.minimum(x, 100.0, out=x)
+    return params.alpha0_1ps_per_Torr * p_Torr * fast_exp_neg(x)
 
 def Q_ohmic_Wpm3(sigma_Spm_val, E_Vpm):
     """Vectorized Ohmic heating QΩ = σ |E|^2."""
-    import numpy as _np
-    sig = _np.asarray(sigma_Spm_val, dtype=float)
-    E = _np.asarray(E_Vpm, dtype=float)
-    return _np.maximum(sig, 0.0) * (_np.abs(E) ** 2)
+    sig = np.asarray(sigma_Spm_val, dtype=float)
+    E = np.asarray(E_Vpm, dtype=float)
+    return np.maximum(sig, 0.0) * (np.abs(E) ** 2)
 
 def Q_loss_Wpm3(ne_m3, Te_eV):
     """Vectorized lumped cooling Qloss = c1 ne Te + c2 ne."""
-    import numpy as _np
-    ne = _np.asarray(ne_m3, dtype=float)
-    Te = _np.asarray(Te_eV, dtype=float)
-    return params.c1_Wpm3peV * _np.maximum(ne, 0.0) * _np.maximum(Te, 0.0) + params.c2_Wpm3 * _np.maximum(ne, 0.0)
+    ne = np.asarray(ne_m3, dtype=float)
+    Te = np.asarray(Te_eV, dtype=float)
+    return params.c1_Wpm3peV * np.maximum(ne, 0.0) * np.maximum(Te, 0.0) + params.c2_Wpm3 * np.maximum(ne, 0.0)
 
 
 def v_loss_mps(Te_eV: float) -> float:
@@ -0,0 +1,199 @@
+"""
+closures_fast.py
+----------------
+Fused per-cell evaluation of the closures used by the PDE coefficients.
+
+`compute_sources` evaluates Da, the ionization-minus-loss rate, σ, QΩ and
+Qloss in a single pass over the cells instead of materializing one full-size
+temporary per `np.maximum`/`np.abs`. With Numba installed the pass is a
+parallel JIT kernel; otherwise a NumPy implementation with identical results
+is used. The formulas mirror those in `closures.py`.
+
+Eφ depends on r only, so the E-dependent factors (ionization rate and |E|^2)
+are evaluated on the (Nr,) radial profile and broadcast over z. Cells follow
+FiPy's Grid2D ordering (r fastest), i.e. cell i sits at radial index i % Nr.
+
+`mode` selects the backend: "numba" (JIT kernel, NumPy if Numba is missing),
+"numpy", or "cupy" (see `closures_gpu`).
+"""
+
+from __future__ import annotations
+import warnings
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+from .closures import params, nu_c_Hz, e, me, S_ion_Hz
+
+# Set once the missing-Numba fallback has been reported
+_warned_no_numba = False
+
+
+def _sources_numpy(ne, Te, S_r, Esq_r, p_Torr, nu, loss_coeff, Da0, c1, c2, want_sigma,
+                   Da, S_minus_loss, sigma, Qohm, Qloss):
+    nr = S_r.size
+    ne_c = np.maximum(ne, 1e10)
+
+    np.maximum(Te, 0.05, out=Da)
+    Da *= Da0 / max(p_Torr, 0.1)
+    S_minus_loss.reshape(-1, nr)[:] = S_r - loss_coeff
+    # QΩ = σ |E|^2 with |E|^2 broadcast from (Nr,); σ is staged in the QΩ buffer
+    # and only copied out when requested
+    np.multiply(ne_c, e * e / (me * max(nu, 1.0)), out=Qohm)
+    if want_sigma:
+        sigma[:] = Qohm
+    Qohm.reshape(-1, nr)[:] *= Esq_r
+    # Qloss = (c1 Te + c2) ne, accumulated in place
+    np.maximum(Te, 0.1, out=Qloss)
+    Qloss *= c1
+    Qloss += c2
+    Qloss *= ne_c
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _sources_kernel(ne, Te, S_r, Esq_r, p_Torr, nu, loss_coeff, Da0, c1, c2, want_sigma,
+                        Da, S_minus_loss, sigma, Qohm, Qloss):
+        n = ne.size
+        nr = S_r.size
+
+        # Scalars hoisted out of the cell loop
+        Da_pref = Da0 / max(p_Torr, 0.1)
+        sig_pref = e * e / (me * max(nu, 1.0))
+
+        for i in prange(n):
+            j = i % nr
+            ne_c = max(ne[i], 1e10)
+            Te_i = Te[i]
+            Te_c = max(Te_i, 0.1)
+
+            Da[i] = Da_pref * max(Te_i, 0.05)
+            S_minus_loss[i] = S_r[j] - loss_coeff
+            # σ and QΩ from a single load of ne
+            sig = sig_pref * ne_c
+            if want_sigma:
+                sigma[i] = sig
+            Qohm[i] = sig * Esq_r[j]
+            Qloss[i] = (c1 * Te_c + c2) * ne_c
+
+else:
+    _sources_kernel = _sources_numpy
+
+
+def radial_factors(Ephi_r, p_Torr: float):
+    """
+    r-only factors on the (Nr,) profile: ionization rate S(|E|) [1/s] and
+    |E|^2 [V^2/m^2], both with the |E| >= 1 floor.
+    """
+    E_abs_r = np.maximum(np.abs(np.asarray(Ephi_r, dtype=np.float64)), 1.0)
+    S_r = np.ascontiguousarray(S_ion_Hz(E_abs_r, p_Torr), dtype=np.float64)
+    return S_r, E_abs_r * E_abs_r
+
+
+def check_layout(ne, Te, Ephi_r) -> None:
+    """
+    Validate the (Nz*Nr,) cell / (Nr,) profile layout the kernels index with
+    i % Nr; a mismatch would otherwise misindex silently.
+    """
+    n, nr = np.size(ne), np.size(Ephi_r)
+    if np.size(Te) != n:
+        raise ValueError(f"ne and Te must have the same size, got {n} and {np.size(Te)}")
+    if nr == 0 or n % nr != 0:
+        raise ValueError(f"cell count {n} is not a multiple of the radial profile size {nr}")
+
+
+def compute_sources(
+    ne,
+    Te,
+    Ephi_r,
+    p_Torr: float,
+    Tgas_K: float,
+    loss_coeff: float,
+    dtype=np.float64,
+    mode: str = "numba",
+    out_sigma: bool = False,
+):
+    """
+    Evaluate all per-cell closure coefficients in one pass.
+
+    Parameters
+    ----------
+    ne, Te : (N,) ndarray
+        Cell values of electron density [1/m^3] and temperature [eV], N = Nz*Nr.
+    Ephi_r : (Nr,) ndarray
+        Radial Eφ profile [V/m] on the cell-center radii.
+    p_Torr, Tgas_K : float
+        Neutral pressure and gas temperature.
+    loss_coeff : float
+        Bulk wall-loss rate 1/τ_wall [1/s], subtracted from the ionization rate.
+    dtype : numpy dtype, optional
+        Precision of the returned arrays. Inputs are read as float64; float32
+        outputs halve the bandwidth of the coefficient stores.
+    mode : {"numba", "numpy", "cupy"}, optional
+        Backend for the per-cell pass.
+    out_sigma : bool, optional
+        Also return the per-cell σ. Off by default: the PDE coefficients only
+        need QΩ, so the σ store (and, for "cupy", its device-to-host copy) is skipped.
+
+    Returns
+    -------
+    Da, S_minus_loss, sigma, Qohm, Qloss : (N,) ndarrays
+        Ambipolar diffusion [m^2/s], net per-ne reaction rate [1/s],
+        conductivity [S/m] (None unless `out_sigma`), Ohmic heating and
+        lumped cooling [W/m^3].
+        Floors match the NumPy path: ne >= 1e10, Te >= 0.1 (0.05 for Da), |E| >= 1.
+    """
+    if mode == "cupy":
+        # The GPU entry point validates the layout itself
+        from .closures_gpu import compute_sources as compute_sources_gpu
+
+        return compute_sources_gpu(
+            ne, Te, Ephi_r, p_Torr, Tgas_K, loss_coeff, dtype=dtype, out_sigma=out_sigma
+        )
+    if mode not in ("numba", "numpy"):
+        raise ValueError(f"unknown acceleration mode {mode!r}")
+    check_layout(ne, Te, Ephi_r)
+    if mode == "numba" and njit is None:
+        global _warned_no_numba
+        if not _warned_no_numba:
+            warnings.warn(
+                "Numba is not installed; accel mode 'numba' falls back to the NumPy "
+                "closures. Install erd-fipy[fast] for the JIT kernel.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            _warned_no_numba = True
+    kernel = _sources_kernel if mode == "numba" else _sources_numpy
+
+    # r-only factors, evaluated on Nr points instead of Nz*Nr
+    S_r, Esq_r = radial_factors(Ephi_r, p_Torr)
+
+    ne = np.ascontiguousarray(ne, dtype=np.float64)
+    Da, S_minus_loss, Qohm, Qloss = (np.empty(ne.size, dtype=dtype) for _ in range(4))
+    # Size-0 placeholder keeps the kernel signature (and Numba's compiled type) fixed
+    sigma = np.empty(ne.size if out_sigma else 0, dtype=dtype)
+
+    nu = nu_c_Hz(p_Torr, Tgas_K)
+    kernel(
+        ne,
+        np.ascontiguousarray(Te, dtype=np.float64),
+        S_r,
+        Esq_r,
+        float(p_Torr),
+        float(nu),
+        float(loss_coeff),
+        params.Da0_m2ps_per_eV_over_Torr,
+        params.c1_Wpm3peV,
+        params.c2_Wpm3,
+        bool(out_sigma),
+        Da,
+        S_minus_loss,
+        sigma,
+        Qohm,
+        Qloss,
+    )
+    return Da, S_minus_loss, sigma if out_sigma else None, Qohm, Qloss
@@ -0,0 +1,88 @@
+"""
+closures_gpu.py
+---------------
+CuPy backend for the fused closure evaluation in `closures_fast`.
+
+Same API and formulas as `closures_fast.compute_sources`, but the per-cell pass
+runs as one CUDA elementwise kernel. The small (Nr,) radial factors are still
+computed on the host; the coefficient arrays are copied back once per step
+because FiPy assembles and solves on the CPU.
+"""
+
+from __future__ import annotations
+import numpy as np
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+from .closures import params, nu_c_Hz, e, me
+from .closures_fast import check_layout, radial_factors
+
+_kernels: dict = {}
+
+
+def _sources_kernel(out_sigma: bool):
+    """Compile the elementwise kernel (with or without the σ output) on first use."""
+    if out_sigma not in _kernels:
+        _kernels[out_sigma] = cp.ElementwiseKernel(
+            "float64 ne, float64 Te, raw float64 S_r, raw float64 Esq_r, int64 nr, "
+            "float64 loss_coeff, float64 Da_pref, float64 sig_pref, float64 c1, float64 c2",
+            "T Da, T S_minus_loss, T Qohm, T Qloss" + (", T sigma" if out_sigma else ""),
+            """
+            const long long j = i % nr;
+            const double ne_c = fmax(ne, 1e10);
+            const double Te_c = fmax(Te, 0.1);
+            const double sig = sig_pref * ne_c;
+            Da = Da_pref * fmax(Te, 0.05);
+            S_minus_loss = S_r[j] - loss_coeff;
+            Qohm = sig * Esq_r[j];
+            Qloss = (c1 * Te_c + c2) * ne_c;
+            """
+            + ("sigma = sig;" if out_sigma else ""),
+            "erd_sources_sigma" if out_sigma else "erd_sources",
+        )
+    return _kernels[out_sigma]
+
+
+def compute_sources(
+    ne,
+    Te,
+    Ephi_r,
+    p_Torr: float,
+    Tgas_K: float,
+    loss_coeff: float,
+    dtype=np.float64,
+    out_sigma: bool = False,
+):
+    """
+    GPU version of `closures_fast.compute_sources`; returns host (NumPy) arrays.
+    σ is only stored and copied back when `out_sigma` is set.
+    """
+    if cp is None:
+        raise RuntimeError("CuPy is not installed. Please install CuPy to use the 'cupy' mode.")
+
+    check_layout(ne, Te, Ephi_r)
+    S_r, Esq_r = radial_factors(Ephi_r, p_Torr)
+    ne_d = cp.asarray(ne, dtype=cp.float64)
+    Te_d = cp.asarray(Te, dtype=cp.float64)
+    out = tuple(cp.empty(ne_d.size, dtype=dtype) for _ in range(5 if out_sigma else 4))
+
+    nu = nu_c_Hz(p_Torr, Tgas_K)
+    _sources_kernel(out_sigma)(
+        ne_d,
+        Te_d,
+        cp.asarray(S_r),
+        cp.asarray(Esq_r),
+        np.int64(S_r.size),
+        float(loss_coeff),
+        params.Da0_m2ps_per_eV_over_Torr / max(p_Torr, 0.1),
+        e * e / (me * max(nu, 1.0)),
+        params.c1_Wpm3peV,
+        params.c2_Wpm3,
+        *out,
+    )
+    Da, S_minus_loss, Qohm, Qloss = (cp.asnumpy(a) for a in out[:4])
+    sigma = cp.asnumpy(out[4]) if out_sigma else None
+    return Da, S_minus_loss, sigma, Qohm, Qloss
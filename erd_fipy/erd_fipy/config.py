@@ -43,6 +43,16 @@ class TimeConfig:
     dt_s: float = 5e-6               # slow-time PDE step [s]
     n_steps: int = 2              # total steps (e.g., 10 ms) (should be 2000)
     save_every: int = 50             # write HDF5 every N steps
+    dtype: str = "float32"           # closure coefficients & saved ne/Te (solver stays float64)
+
+@dataclass
+class SolverConfig:
+    tolerance: float = 1e-10         # Krylov relative residual tolerance
+    iterations: int = 1000           # max Krylov iterations per solve
+
+@dataclass
+class AccelerationConfig:
+    mode: str = "numba"              # closure backend: "numpy" | "numba" | "cupy"
 
 @dataclass
 class OutputConfig:
@@ -60,5 +70,7 @@ rf       = RFConfig()
 gas      = GasConfig()
 icbc     = InitBCConfig()
 time     = TimeConfig()
+solver   = SolverConfig()
+accel    = AccelerationConfig()
 output   = OutputConfig()
 toggles  = ModelToggles()
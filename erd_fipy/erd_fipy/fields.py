@@ -19,6 +19,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from .config import geometry as G, rf as RF
 from .closures import sigma_uniform_equiv
 
@@ -30,12 +35,94 @@ class FieldProfiles:
     Bz_T: np.ndarray       # axial magnetic field [T] (magnitude profile)
 
 
+# Per-r_m caches; r_m (and R) are fixed across steps, so these are hit every
+# step after the first. Each cache keeps its own copy of r_m and is matched by
+# value, so callers may reuse or modify their r_m array in place.
+_weights_cache: dict = {}     # area weights (w, Σw)
+_Ephi_shape_cache: dict = {}  # unit-amplitude Eφ shape
+_Bz_decay_cache: dict = {}    # exp(-k r) for the last k
+
+# Relative change in k below which the cached exp(-k r) is reused
+_BZ_K_RTOL = 1e-6
+
+
+def _cache_valid(cache: dict, r_m: np.ndarray) -> bool:
+    r_cached = cache.get("r_m")
+    return r_cached is not None and np.array_equal(r_cached, r_m)
+
+
 def _parabolic_Ephi(r: np.ndarray, R: float, E0: float) -> np.ndarray:
     """
     Smooth non-singular Eφ profile: finite at axis, vanishes at wall.
+    Only the E0 scaling is redone per call; the shape is cached per (r, R).
+    """
+    if not (_cache_valid(_Ephi_shape_cache, r) and _Ephi_shape_cache["R"] == R):
+        x = np.clip(r / max(R, 1e-9), 0.0, 1.0)
+        _Ephi_shape_cache.update(r_m=r.copy(), R=R, shape=1.0 - x**2)
+    return E0 * _Ephi_shape_cache["shape"]
+
+
+def _Bz_decay(r: np.ndarray, k: float) -> np.ndarray:
+    """
+    Radial attenuation exp(-k r), recomputed only when k moves by more than
+    _BZ_K_RTOL (σ̄ is a weighted mean that barely changes between steps).
+    """
+    if not (
+        _cache_valid(_Bz_decay_cache, r)
+        and abs(k - _Bz_decay_cache["k"]) <= _BZ_K_RTOL * abs(_Bz_decay_cache["k"])
+    ):
+        _Bz_decay_cache.update(r_m=r.copy(), k=k, decay=np.exp(-k * r))
+    return _Bz_decay_cache["decay"]
+
+
+def _area_weights(r_m: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Cylindrical area weights w ~ r (floored away from zero) and their sum.
     """
-    x = np.clip(r / max(R, 1e-9), 0.0, 1.0)
-    return E0 * (1.0 - x**2)
+    if not _cache_valid(_weights_cache, r_m):
+        w = np.maximum(r_m, 1e-9)
+        _weights_cache.update(r_m=r_m.copy(), w=w, w_sum=float(w.sum()))
+    return _weights_cache["w"], _weights_cache["w_sum"]
+
+
+if njit is not None:
+
+    @njit(fastmath=True, cache=True)
+    def _weighted_mean_kernel(sig, r_m):
+        num = 0.0
+        den = 0.0
+        for i in range(sig.size):
+            w = r_m[i] if r_m[i] > 1e-9 else 1e-9
+            num += sig[i] * w
+            den += w
+        return num / den
+
+
+def _weighted_mean(sig: np.ndarray, r_m: np.ndarray) -> float:
+    """
+    Area-weighted mean Σ σ w / Σ w with w ~ r. Single fused pass when Numba is
+    available, otherwise a dot product against the cached weights.
+    """
+    if njit is not None:
+        sig = np.ascontiguousarray(sig, dtype=np.float64)
+        r_m = np.ascontiguousarray(r_m, dtype=np.float64)
+        return float(_weighted_mean_kernel(sig, r_m))
+    w, w_sum = _area_weights(r_m)
+    return float(np.dot(sig, w) / w_sum)
+
+
+def _sample_sigma(sigma_profile, r_m: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a callable σ(r) over r_m. NumPy-aware callables are called once on
+    the whole array; scalar-only callables fall back to per-point evaluation.
+    """
+    try:
+        sig = np.asarray(sigma_profile(r_m), dtype=float)
+        if sig.shape == r_m.shape:
+            return sig
+    except (TypeError, ValueError):
+        pass
+    return np.fromiter((sigma_profile(r) for r in r_m), dtype=float, count=r_m.size)
 
 
 def _effective_sigma(ne_m3, Te_eV, sigma_profile, r_m) -> float:
@@ -52,14 +139,12 @@ def _effective_sigma(ne_m3, Te_eV, sigma_profile, r_m) -> float:
         if sig.shape != r_m.shape:
             raise ValueError("sigma_profile array must have same shape as r_m")
         # area weighting in cylinder: weight ~ r
-        w = np.maximum(r_m, 1e-9)
-        return float(np.sum(sig * w) / np.sum(w))
+        return _weighted_mean(sig, r_m)
 
     # Case (2) callable
     if callable(sigma_profile):
-        sig = np.asarray([float(sigma_profile(r)) for r in r_m])
-        w = np.maximum(r_m, 1e-9)
-        return float(np.sum(sig * w) / np.sum(w))
+        sig = _sample_sigma(sigma_profile, r_m)
+        return _weighted_mean(sig, r_m)
 
     # Case (3) fallback to uniform σ from average ne, Te
     ne_avg = float(np.mean(ne_m3)) if np.ndim(ne_m3) else float(ne_m3)
@@ -110,6 +195,6 @@ def compute_fields(
     # Scale Bz so that characteristic |∂t B| ~ |∇×E|
     # Use |B| ~ |E| / ω near axis, then apply radial attenuation exp(-k r)
     B_scale = max(E0, 1e-12) / max(omega, 1e-12)
-    Bz = B_scale * np.exp(-k * r_m)
+    Bz = B_scale * _Bz_decay(r_m, float(k))
 
     return FieldProfiles(r_m=r_m, Ephi_Vpm=Ephi, Bz_T=Bz)
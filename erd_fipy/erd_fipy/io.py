@@ -1,43 +1,103 @@
 """
 HDF5 output writer for snapshots compatible with downstream ROM/SINDy ingestion.
+
+Snapshots are staged in small in-RAM buffers and flushed in blocks, so HDF5
+metadata/resizes are paid once per `buffer_size` snapshots. Field datasets are
+chunked one snapshot per chunk (the natural time-series access unit) and LZF
+compressed.
 """
 from __future__ import annotations
 import os, h5py, numpy as np
 
+# One row of the /inputs/log table per snapshot
+inputs_dtype = np.dtype([("E0_Vpm", "f8"), ("phase_deg", "f8"), ("freq_Hz", "f8")])
+
 class H5Writer:
-    def __init__(self, outdir: str, run_name: str, r: np.ndarray, z: np.ndarray):
+    def __init__(
+        self,
+        outdir: str,
+        run_name: str,
+        r: np.ndarray,
+        z: np.ndarray,
+        n_snapshots: int | None = None,
+        buffer_size: int = 8,
+        field_dtype: str = "f8",
+    ):
+        """
+        n_snapshots : expected number of snapshots; datasets are pre-sized to it
+            (and grown past it if needed, trimmed on close if fewer were written).
+        buffer_size : snapshots held in RAM between flushes.
+        field_dtype : storage dtype of the ne/Te snapshots ("f4" halves the file size).
+        """
         self.path = os.path.join(outdir, f"{run_name}.h5")
         self._h = h5py.File(self.path, "w")
+        n0 = int(n_snapshots or 0)
         # Coordinates
         self._h.create_dataset("/coords/r", data=r)
         self._h.create_dataset("/coords/z", data=z)
-        # Inputs log
-        self._inputs_grp = self._h.create_group("/inputs")
+        # Inputs log (one compound row per snapshot)
+        self._inputs = self._h.create_dataset(
+            "/inputs/log", shape=(n0,), maxshape=(None,), dtype=inputs_dtype, chunks=(256,)
+        )
         # Time axis
-        self._t = self._h.create_dataset("/time/t", shape=(0,), maxshape=(None,), dtype="f8")
+        self._t = self._h.create_dataset(
+            "/time/t", shape=(n0,), maxshape=(None,), dtype="f8", chunks=(1024,)
+        )
         # Fields (extendable along time dim)
-        self._Bz = self._h.create_dataset("/fields/Bz", shape=(0, r.size), maxshape=(None, r.size), dtype="f8")
-        self._ne = self._h.create_dataset("/fields/ne", shape=(0, z.size, r.size), maxshape=(None, z.size, r.size), dtype="f8")
-        self._Te = self._h.create_dataset("/fields/Te", shape=(0, z.size, r.size), maxshape=(None, z.size, r.size), dtype="f8")
+        self._Bz = self._h.create_dataset(
+            "/fields/Bz", shape=(n0, r.size), maxshape=(None, r.size), dtype="f8",
+            chunks=(64, r.size), compression="lzf",
+        )
+        self._ne = self._h.create_dataset(
+            "/fields/ne", shape=(n0, z.size, r.size), maxshape=(None, z.size, r.size),
+            dtype=field_dtype,
+            chunks=(1, z.size, r.size), compression="lzf",
+        )
+        self._Te = self._h.create_dataset(
+            "/fields/Te", shape=(n0, z.size, r.size), maxshape=(None, z.size, r.size),
+            dtype=field_dtype,
+            chunks=(1, z.size, r.size), compression="lzf",
+        )
         self._i = 0
 
-    def _append(self, ds, arr):
-        ds.resize((self._i + 1,) + ds.shape[1:])
-        ds[self._i] = arr
+        # In-RAM staging buffers, flushed every `buffer_size` snapshots
+        K = max(int(buffer_size), 1)
+        self._buf = {
+            ds: np.empty((K,) + ds.shape[1:], dtype=ds.dtype)
+            for ds in (self._t, self._Bz, self._ne, self._Te, self._inputs)
+        }
+        self._nbuf = 0
+
+    def _flush(self):
+        n = self._nbuf
+        if n == 0:
+            return
+        i0 = self._i - n
+        for ds, buf in self._buf.items():
+            if ds.shape[0] < self._i:
+                ds.resize((self._i,) + ds.shape[1:])
+            ds.write_direct(buf, source_sel=np.s_[:n], dest_sel=np.s_[i0:self._i])
+        self._nbuf = 0
 
     def write_snapshot(self, t: float, Bz_r: np.ndarray, ne_zr: np.ndarray, Te_zr: np.ndarray, inputs):
-        self._append(self._t, np.array(t))
-        self._append(self._Bz, Bz_r)
-        self._append(self._ne, ne_zr.reshape(self._ne.shape[1:]))
-        self._append(self._Te, Te_zr.reshape(self._Te.shape[1:]))
-        # Log inputs for this snapshot
-        g = self._inputs_grp.create_group(f"{self._i}")
-        g.create_dataset("E0_Vpm", data=float(inputs.E0_Vpm))
-        g.create_dataset("phase_deg", data=float(inputs.phase_deg))
-        g.create_dataset("freq_Hz", data=float(inputs.freq_Hz))
+        k = self._nbuf
+        self._buf[self._t][k] = t
+        self._buf[self._Bz][k] = Bz_r
+        # Copy straight into the reused staging slots; callers may pass live arrays
+        np.copyto(self._buf[self._ne][k], ne_zr.reshape(self._ne.shape[1:]), casting="same_kind")
+        np.copyto(self._buf[self._Te][k], Te_zr.reshape(self._Te.shape[1:]), casting="same_kind")
+        self._buf[self._inputs][k] = (inputs.E0_Vpm, inputs.phase_deg, inputs.freq_Hz)
+        self._nbuf += 1
         self._i += 1
+        if self._nbuf == len(self._buf[self._t]):
+            self._flush()
 
     def close(self):
         if self._h is not None:
+            self._flush()
+            # Trim pre-sized datasets if fewer snapshots were written
+            for ds in self._buf:
+                if ds.shape[0] > self._i:
+                    ds.resize((self._i,) + ds.shape[1:])
             self._h.close()
             self._h = None
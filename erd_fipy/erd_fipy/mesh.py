@@ -14,7 +14,10 @@ except ImportError:
 
 def make_mesh():
     """
-    Returns (mesh, r_coords, z_coords)
+    Returns (mesh, r_coords, z_coords, r_cells, z_cells)
+    r_coords, z_coords are the (Nr,), (Nz,) cell-center axes; r_cells, z_cells are
+    per-cell copies of mesh.x / mesh.y, cached so the hot path never touches the
+    FiPy accessors (which rebuild their arrays on every access).
     Units: r, z in meters.
     """
     if Grid2D is None:
@@ -30,6 +33,10 @@ def make_mesh():
     # coordinate arrays (cell centers)
     r = (np.arange(G.Nr) + 0.5) * dr
     z = (np.arange(G.Nz) + 0.5) * dz
-    return mesh, r, z
+
+    # per-cell coordinates (FiPy Grid2D: x->r, y->z)
+    r_cells = np.asarray(mesh.x).copy()
+    z_cells = np.asarray(mesh.y).copy()
+    return mesh, r, z, r_cells, z_cells
 
 make_mesh()
\ No newline at end of file
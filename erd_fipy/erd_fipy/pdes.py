@@ -16,23 +16,68 @@ with the τ_wall bulk sink, which captures the correct time scale.
 """
 
 from __future__ import annotations
+from dataclasses import dataclass
 import numpy as np
 
 try:
     from fipy import CellVariable, DiffusionTerm, TransientTerm, ImplicitSourceTerm
-    from fipy.tools import numerix
 except ImportError as e:
     CellVariable = None
 
-from .config import geometry as G, rf as RF, gas as GAS, icbc as ICBC
-from .closures import (
-    Da_m2ps,
-    S_ion_Hz,
-    Q_ohmic_Wpm3,
-    Q_loss_Wpm3,
-    sigma_Spm,
-    tau_wall_s,
+# Solver classes depend on the active FiPy solver suite, so they are checked separately
+try:
+    from fipy import LinearPCGSolver, JacobiPreconditioner
+except ImportError:
+    LinearPCGSolver = None
+
+from .config import (
+    geometry as G,
+    rf as RF,
+    gas as GAS,
+    icbc as ICBC,
+    time as TCFG,
+    solver as SOLVER,
+    accel as ACCEL,
 )
+from .closures import Da_m2ps, tau_wall_s
+from .closures_fast import compute_sources
+
+
+@dataclass
+class StepContext:
+    """
+    Per-run constants hoisted out of the stepping loop. Geometry and gas are
+    fixed for a run; RF amplitude/frequency stay live since they are control inputs.
+    """
+    Rm: float               # cylinder radius [m]
+    p_Torr: float           # neutral pressure [Torr]
+    Tgas_K: float           # gas temperature [K]
+    r_unique: np.ndarray    # (Nr,) radial cell centers [m]
+    accel_mode: str         # closure backend passed to compute_sources
+
+
+def build_step_context(r_cells: np.ndarray) -> StepContext:
+    """
+    Build the StepContext from the cached per-cell radii (see mesh.make_mesh)
+    and the current config.
+    """
+    r_unique = np.unique(r_cells)
+    # The closure kernels map cell i to radius r_unique[i % Nr]: check that the
+    # radii form exactly Nr columns repeated Nz times with r varying fastest
+    if r_unique.size * G.Nz != r_cells.size or not np.array_equal(
+        r_cells.reshape(G.Nz, -1), np.broadcast_to(r_unique, (G.Nz, r_unique.size))
+    ):
+        raise ValueError(
+            f"cell radii do not form a ({G.Nz}, {r_unique.size}) r-fastest grid "
+            f"({r_cells.size} cells)"
+        )
+    return StepContext(
+        Rm=G.R_cm * 1e-2,
+        p_Torr=GAS.p_Torr,
+        Tgas_K=GAS.Tgas_K,
+        r_unique=r_unique,
+        accel_mode=ACCEL.mode,
+    )
 
 
 def build_state_vars(mesh):
@@ -45,21 +90,32 @@ def build_state_vars(mesh):
 
     Rm = G.R_cm * 1e-2
     # Parabolic initial ne profile in r, uniform in z
-    ne_init = ICBC.ne0_m3 * (1.0 - (mesh.x / max(Rm, 1e-12)) ** 2)
-    ne_init = np.clip(ne_init, 0.0, None)
+    # ne0 * max(1 - (r/R)^2, 0), evaluated in place in one buffer
+    x = np.asarray(mesh.x)
+    ne_init = np.empty_like(x, dtype=float)
+    np.divide(x, max(Rm, 1e-12), out=ne_init)
+    np.square(ne_init, out=ne_init)
+    np.subtract(1.0, ne_init, out=ne_init)
+    np.multiply(ne_init, ICBC.ne0_m3, out=ne_init)
+    np.maximum(ne_init, 0.0, out=ne_init)
 
     ne = CellVariable(name="ne", mesh=mesh, value=ne_init)
     Te = CellVariable(name="Te", mesh=mesh, value=ICBC.Te0_eV)
     return ne, Te
 
 
-def build_equations(mesh, ne, Te, fields_module, sigma_profile=None):
+def build_equations_once(mesh, ctx, ne, Te, fields_module, sigma_profile=None):
     """
-    Build FiPy equations for n_e and optionally T_e.
+    Build FiPy equations for n_e and optionally T_e once per run.
+
+    The PDE structure is fixed; only the coefficient fields change between
+    steps. Coefficients live in CellVariables that are refreshed in place by
+    `update_coefficients`, so the operator graph is never rebuilt.
 
     Parameters
     ----------
     mesh : FiPy mesh
+    ctx : StepContext
     ne, Te : CellVariable
     fields_module : module with compute_fields(r, ne, Te, sigma_profile=None) -> profiles
     sigma_profile : None | array-like | callable
@@ -68,42 +124,23 @@ def build_equations(mesh, ne, Te, fields_module, sigma_profile=None):
     Returns
     -------
     eqs : list of FiPy terms (equations)
-    profiles : FieldProfiles (r, Eφ(r), Bz(r)) for the current step
+    coeffs : dict of coefficient CellVariables ("Da", "reaction", and if the
+        energy equation is enabled "hc", "kappa", "Qnet")
+    profiles : FieldProfiles (r, Eφ(r), Bz(r)) for the initial state
     """
     if CellVariable is None:
         raise RuntimeError("FiPy is not installed. Please install FiPy to run the PDE solver.")
 
-    Rm = G.R_cm * 1e-2
-
-    # Radial coordinates for cells (FiPy Grid2D: x->r, y->z)
-    r_cells = numerix.array(mesh.x)
-
-    # Update field surrogate (use current averages for uniform-σ fallback)
-    profiles = fields_module.compute_fields(
-        r_m=np.unique(r_cells),
-        ne_m3=ne.value.mean(),
-        Te_eV=Te.value.mean(),
-        sigma_profile=sigma_profile,
-    )
-
-    # Interpolate Eφ(r) to cell centers
-    Ephi_cells = np.interp(r_cells, profiles.r_m, profiles.Ephi_Vpm)
+    # Coefficients are stored at TCFG.dtype precision; FiPy still assembles
+    # and solves the linear system in float64
+    def zeros():
+        return np.zeros(mesh.numberOfCells, dtype=TCFG.dtype)
 
     # -------- Electron density equation --------
     # Ambipolar diffusion coefficient Da(Te, p) as a CellVariable for spatial variation
-    Da_array = Da_m2ps(np.maximum(Te.value, 0.05), GAS.p_Torr)   # numpy array [m^2/s]
-    Da_cells = CellVariable(name="Da", mesh=mesh, value=Da_array)
-
-    # --- Ionization - loss coefficient (per-ne) as a CellVariable ---
-    # S_coeff: numpy array [1/s] from |Eφ|
-    # loss_coeff: scalar [1/s] from τ_wall
-    S_coeff = S_ion_Hz(np.maximum(np.abs(Ephi_cells), 1.0), GAS.p_Torr)  # numpy array
-    Da_mean = float(np.maximum(Te.value.mean(), 0.05))
-    Da_mean = Da_m2ps(Da_mean, GAS.p_Torr)
-    tauw = tau_wall_s(Rm, Da_mean)
-    loss_coeff = 1.0 / max(tauw, 1e-9)
-
-    reaction_cells = CellVariable(name="S_minus_loss", mesh=mesh, value=S_coeff - loss_coeff)
+    Da_cells = CellVariable(name="Da", mesh=mesh, value=zeros())
+    # Ionization - loss coefficient (per-ne) as a CellVariable
+    reaction_cells = CellVariable(name="S_minus_loss", mesh=mesh, value=zeros())
 
     # --- Fully implicit ne-equation ---
     ne_eq = (
@@ -113,33 +150,16 @@ def build_equations(mesh, ne, Te, fields_module, sigma_profile=None):
     )
 
     eqs = [ne_eq]
+    coeffs = {"Da": Da_cells, "reaction": reaction_cells}
 
     # -------- Electron energy equation (optional) --------
     if RF.use_energy_eq:
         # Heat capacity (lumped): (3/2) n_e  in "FiPy units"
-        heat_capacity_arr = 1.5 * np.maximum(ne.value, 1e10)
-        heat_capacity = CellVariable(name="hc", mesh=mesh, value=heat_capacity_arr)
-
+        heat_capacity = CellVariable(name="hc", mesh=mesh, value=zeros())
         # Thermal conductivity κ ~ k0 * Te; keep scalar & modest to avoid stiffness
-        kappa_arr = 0.5 * np.maximum(Te.value, 0.1)  # W/m/K (placeholder scaling)
-        kappa = CellVariable(name="kappa", mesh=mesh, value=kappa_arr)
-
-        # Ohmic heating density: QΩ = σ |E|^2  (σ from local (ne,Te))
-        sigma_cells_arr = sigma_Spm(
-            ne_m3=np.maximum(ne.value, 1e10),
-            Te_eV=np.maximum(Te.value, 0.1),
-            p_Torr=GAS.p_Torr,
-            Tgas_K=GAS.Tgas_K,
-        )
-        Qohm = Q_ohmic_Wpm3(sigma_cells_arr, np.maximum(np.abs(Ephi_cells), 1.0))
-
-        # Lumped cooling
-        Qloss = Q_loss_Wpm3(np.maximum(ne.value, 1e10), np.maximum(Te.value, 0.1))
-        heat_source = CellVariable(
-            name="Q_net",
-            mesh=mesh,
-            value=Qohm - Qloss,
-        )
+        kappa = CellVariable(name="kappa", mesh=mesh, value=zeros())
+        # Net heating: Ohmic minus lumped cooling
+        heat_source = CellVariable(name="Q_net", mesh=mesh, value=zeros())
 
         Te_eq = (
             TransientTerm(coeff=heat_capacity, var=Te)
@@ -147,5 +167,81 @@ def build_equations(mesh, ne, Te, fields_module, sigma_profile=None):
             + heat_source  # explicit source term is OK
         )
         eqs.append(Te_eq)
+        coeffs.update(hc=heat_capacity, kappa=kappa, Qnet=heat_source)
+
+    profiles = update_coefficients(coeffs, ctx, ne, Te, fields_module, sigma_profile)
+    return eqs, coeffs, profiles
 
-    return eqs, profiles
+
+def update_coefficients(coeffs, ctx, ne, Te, fields_module, sigma_profile=None):
+    """
+    Recompute coefficient arrays from the current (ne, Te) and write them into
+    the CellVariables built by `build_equations_once`.
+
+    Returns
+    -------
+    profiles : FieldProfiles (r, Eφ(r), Bz(r)) for the current step
+    """
+    # Update field surrogate (use current averages for uniform-σ fallback)
+    profiles = fields_module.compute_fields(
+        r_m=ctx.r_unique,
+        ne_m3=ne.value.mean(),
+        Te_eV=Te.value.mean(),
+        sigma_profile=sigma_profile,
+    )
+
+    # Bulk wall-loss rate [1/s] from τ_wall at the mean temperature
+    Da_mean = float(np.maximum(Te.value.mean(), 0.05))
+    Da_mean = Da_m2ps(Da_mean, ctx.p_Torr)
+    tauw = tau_wall_s(ctx.Rm, Da_mean)
+    loss_coeff = 1.0 / max(tauw, 1e-9)
+
+    # All per-cell closures (Da, S - loss, QΩ, Qloss) in one fused pass; σ itself
+    # is not needed here. Eφ(r) is defined on the cell radii and broadcast over z
+    Da_array, S_minus_loss, _, Qohm, Qloss = compute_sources(
+        ne.value, Te.value, profiles.Ephi_Vpm, ctx.p_Torr, ctx.Tgas_K, loss_coeff,
+        dtype=TCFG.dtype, mode=ctx.accel_mode,
+    )
+
+    # -------- Electron density coefficients --------
+    coeffs["Da"].setValue(Da_array)
+    coeffs["reaction"].setValue(S_minus_loss)
+
+    # -------- Electron energy coefficients (optional) --------
+    if "Qnet" in coeffs:
+        hc = 1.5 * np.maximum(ne.value, 1e10)
+        kappa = 0.5 * np.maximum(Te.value, 0.1)  # W/m/K (placeholder scaling)
+        Qohm -= Qloss
+        coeffs["hc"].setValue(hc.astype(TCFG.dtype, copy=False))
+        coeffs["kappa"].setValue(kappa.astype(TCFG.dtype, copy=False))
+        coeffs["Qnet"].setValue(Qohm)
+
+    return profiles
+
+
+def build_solvers(eqs):
+    """
+    One linear solver per equation, created once per run.
+
+    Both equations are symmetric (diffusion + transient + implicit source on a
+    uniform grid), so Jacobi-preconditioned CG from the active FiPy solver suite
+    replaces FiPy's default (LU with the SciPy suite), with the tolerance and
+    iteration cap pinned by `SolverConfig`. FiPy still rebuilds the matrix and
+    the preconditioner on every solve; only the solver object is shared.
+    """
+    if CellVariable is None:
+        raise RuntimeError("FiPy is not installed. Please install FiPy to run the PDE solver.")
+    if LinearPCGSolver is None:
+        raise RuntimeError(
+            "The active FiPy solver suite does not provide LinearPCGSolver and "
+            "JacobiPreconditioner. Select a suite that does (e.g. FIPY_SOLVERS=scipy)."
+        )
+
+    return [
+        LinearPCGSolver(
+            tolerance=SOLVER.tolerance,
+            iterations=SOLVER.iterations,
+            precon=JacobiPreconditioner(),
+        )
+        for _ in eqs
+    ]
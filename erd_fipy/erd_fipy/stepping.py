@@ -8,7 +8,13 @@ import numpy as np, os
 from .config import rf as RF, time as TCFG, output as OUT
 from .mesh import make_mesh
 from . import fields as fields_backend
-from .pdes import build_state_vars, build_equations
+from .pdes import (
+    build_step_context,
+    build_state_vars,
+    build_equations_once,
+    update_coefficients,
+    build_solvers,
+)
 from .io import H5Writer
 
 @dataclass
@@ -24,28 +30,47 @@ def run_sim(seed: int = 0, sigma_profile=None):
     """
     np.random.seed(seed)
 
-    mesh, r, z = make_mesh()
+    mesh, r, z, r_cells, _z_cells = make_mesh()
     ne, Te = build_state_vars(mesh)
 
     os.makedirs(OUT.outdir, exist_ok=True)
-    writer = H5Writer(OUT.outdir, OUT.run_name, r, z)
+    # Snapshot schedule: every save_every steps plus the final step
+    save_steps = set(range(0, TCFG.n_steps, TCFG.save_every)) | {TCFG.n_steps - 1}
+    save_steps.discard(-1)
+    writer = H5Writer(
+        OUT.outdir, OUT.run_name, r, z, n_snapshots=len(save_steps), field_dtype=TCFG.dtype
+    )
 
-    for k in range(TCFG.n_steps):
-        # (Optional) vary control here if you want closed-loop later
-        u = ControlInputs(E0_Vpm=RF.E0_Vpm, phase_deg=RF.phase_deg, freq_Hz=RF.freq_Hz)
+    # Always close (and so flush staged snapshots), even if a step fails
+    try:
+        # Static per-run quantities, then equations assembled once; only their
+        # coefficients change per step
+        ctx = build_step_context(r_cells)
+        eqs, coeffs, prof = build_equations_once(
+            mesh, ctx, ne, Te, fields_backend, sigma_profile=sigma_profile
+        )
+        solvers = build_solvers(eqs)
 
-        # Build equations with current fields (uses ne, Te averages internally)
-        eqs, prof = build_equations(mesh, ne, Te, fields_backend, sigma_profile=sigma_profile)
+        for k in range(TCFG.n_steps):
+            # (Optional) vary control here if you want closed-loop later
+            u = ControlInputs(E0_Vpm=RF.E0_Vpm, phase_deg=RF.phase_deg, freq_Hz=RF.freq_Hz)
 
-        # Advance one slow-time step
-        dt = TCFG.dt_s
-        for eq in eqs:
-            eq.sweep(dt=dt)
+            # Refresh coefficients with current fields (uses ne, Te averages internally)
+            if k > 0:
+                prof = update_coefficients(
+                    coeffs, ctx, ne, Te, fields_backend, sigma_profile=sigma_profile
+                )
 
-        # Save periodically
-        if (k % TCFG.save_every) == 0 or (k == TCFG.n_steps - 1):
-            t = (k + 1) * dt
-            writer.write_snapshot(t, prof.Bz_T, ne.value.copy(), Te.value.copy(), u)
+            # Advance one slow-time step
+            dt = TCFG.dt_s
+            # Single linear solve per equation (a lone sweep only adds a residual evaluation)
+            for eq, solver in zip(eqs, solvers):
+                eq.solve(dt=dt, solver=solver)
 
-    writer.close()
+            # Save periodically (the writer copies into its own staging buffers)
+            if k in save_steps:
+                t = (k + 1) * dt
+                writer.write_snapshot(t, prof.Bz_T, ne.value, Te.value, u)
+    finally:
+        writer.close()
     return os.path.join(OUT.outdir, f"{OUT.run_name}.h5")
@@ -0,0 +1,10 @@
+"""
+Put the erd_fipy project directory first on sys.path, so `import erd_fipy`
+resolves to the package rather than the project folder (which would import
+as a namespace package) when pytest runs from the workspace root.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,66 @@
+"""
+closures.fast_exp_neg against np.exp, for the Numba polynomial and for the
+fallbacks used when Numba (and numexpr) are not installed.
+"""
+
+import importlib.util
+import math
+import sys
+
+import numpy as np
+import pytest
+
+from erd_fipy import closures
+
+# The closures clip the exponent argument to [-100, 100]
+X = np.concatenate([np.linspace(-100.0, 100.0, 200_001), [-100.0, -0.0, 0.0, 100.0]])
+
+
+def _rel_err(got, x):
+    ref = np.exp(-x)
+    return np.max(np.abs(got - ref) / ref)
+
+
+def _load_closures_without(monkeypatch, *modules):
+    """Fresh copy of closures.py imported with the given optional modules hidden."""
+    for name in modules:
+        monkeypatch.setitem(sys.modules, name, None)
+    spec = importlib.util.spec_from_file_location("erd_fipy._closures_fallback", closures.__file__)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)  # needed by @dataclass
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_exp_neg_scalar_polynomial():
+    xs = X[::1000]
+    got = np.array([closures._exp_neg_scalar(float(x)) for x in xs])
+    assert _rel_err(got, xs) < 1e-8
+    assert closures._exp_neg_scalar(0.0) == 1.0
+    assert math.isfinite(closures._exp_neg_scalar(-100.0))
+
+
+def test_fast_exp_neg():
+    assert _rel_err(closures.fast_exp_neg(X), X) < 1e-8
+
+
+@pytest.mark.skipif(closures.vectorize is None, reason="Numba is not installed")
+def test_fast_exp_neg_is_the_numba_polynomial():
+    xs = X[::1000]
+    expected = np.array([closures._exp_neg_scalar(float(x)) for x in xs])
+    # fastmath may reorder the Horner steps, so only agreement to a few ulp
+    np.testing.assert_allclose(closures.fast_exp_neg(xs), expected, rtol=1e-13)
+
+
+def test_fast_exp_neg_numpy_fallback(monkeypatch):
+    fallback = _load_closures_without(monkeypatch, "numba", "numexpr")
+    assert fallback.vectorize is None and fallback.numexpr is None
+    assert _rel_err(fallback.fast_exp_neg(X), X) < 1e-8
+    assert _rel_err(fallback.fast_exp_neg(list(X[:10])), X[:10]) < 1e-8
+
+
+def test_fast_exp_neg_numexpr_fallback(monkeypatch):
+    pytest.importorskip("numexpr")
+    fallback = _load_closures_without(monkeypatch, "numba")
+    assert fallback.vectorize is None and fallback.numexpr is not None
+    assert _rel_err(fallback.fast_exp_neg(X), X) < 1e-8
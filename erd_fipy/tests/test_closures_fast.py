@@ -0,0 +1,86 @@
+"""
+Parity of the fused closure pass (closures_fast.compute_sources) with the
+reference closures in closures.py, for each backend and output precision.
+"""
+
+import numpy as np
+import pytest
+
+from erd_fipy import closures_fast, closures_gpu
+from erd_fipy.closures import Da_m2ps, S_ion_Hz, sigma_Spm, Q_ohmic_Wpm3, Q_loss_Wpm3
+
+NZ, NR = 6, 9
+P_TORR, TGAS_K, LOSS = 0.8, 300.0, 25.0
+
+MODES = [
+    "numpy",
+    pytest.param(
+        "numba",
+        marks=pytest.mark.skipif(closures_fast.njit is None, reason="Numba is not installed"),
+    ),
+    pytest.param(
+        "cupy",
+        marks=pytest.mark.skipif(closures_gpu.cp is None, reason="CuPy is not installed"),
+    ),
+]
+RTOL = {np.float64: 1e-10, np.float32: 1e-6}
+
+
+def _inputs(seed=0):
+    """Random (Nz*Nr,) ne/Te and (Nr,) Eφ that include every floor case."""
+    rng = np.random.default_rng(seed)
+    ne = 10.0 ** rng.uniform(8.0, 18.0, NZ * NR)
+    ne[:4] = [-1e12, 0.0, 1e9, 1e10]  # ne floor 1e10
+    Te = rng.uniform(0.0, 8.0, NZ * NR)
+    Te[4:8] = [-1.0, 0.0, 0.07, 0.1]  # Te floors 0.05 (Da) and 0.1
+    Ephi_r = rng.uniform(-5e3, 5e3, NR)
+    Ephi_r[:3] = [0.0, 0.5, -0.2]  # |E| floor 1
+    return ne, Te, Ephi_r
+
+
+def _reference(ne, Te, Ephi_r):
+    """Same floors as the fused pass, evaluated with the closures.py functions."""
+    ne_c = np.maximum(ne, 1e10)
+    E_abs = np.tile(np.maximum(np.abs(Ephi_r), 1.0), NZ)
+    sigma = sigma_Spm(ne_c, Te, P_TORR, TGAS_K)
+    return (
+        Da_m2ps(np.maximum(Te, 0.05), P_TORR),
+        S_ion_Hz(E_abs, P_TORR) - LOSS,
+        sigma,
+        Q_ohmic_Wpm3(sigma, E_abs),
+        Q_loss_Wpm3(ne_c, np.maximum(Te, 0.1)),
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("mode", MODES)
+def test_compute_sources_matches_closures(mode, dtype):
+    ne, Te, Ephi_r = _inputs()
+    out = closures_fast.compute_sources(
+        ne, Te, Ephi_r, P_TORR, TGAS_K, LOSS, dtype=dtype, mode=mode, out_sigma=True
+    )
+    names = ("Da", "S_minus_loss", "sigma", "Qohm", "Qloss")
+    for name, got, ref in zip(names, out, _reference(ne, Te, Ephi_r)):
+        assert got.dtype == dtype, name
+        np.testing.assert_allclose(got, ref, rtol=RTOL[dtype], atol=0, err_msg=name)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_compute_sources_sigma_optional(mode):
+    ne, Te, Ephi_r = _inputs(seed=1)
+    with_sigma = closures_fast.compute_sources(
+        ne, Te, Ephi_r, P_TORR, TGAS_K, LOSS, mode=mode, out_sigma=True
+    )
+    without = closures_fast.compute_sources(ne, Te, Ephi_r, P_TORR, TGAS_K, LOSS, mode=mode)
+    assert without[2] is None
+    for got, ref in zip(without[:2] + without[3:], with_sigma[:2] + with_sigma[3:]):
+        np.testing.assert_array_equal(got, ref)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_compute_sources_rejects_bad_layout(mode):
+    ne, Te, Ephi_r = _inputs()
+    with pytest.raises(ValueError):
+        closures_fast.compute_sources(ne, Te, Ephi_r[:-1], P_TORR, TGAS_K, LOSS, mode=mode)
+    with pytest.raises(ValueError):
+        closures_fast.compute_sources(ne, Te[:-1], Ephi_r, P_TORR, TGAS_K, LOSS, mode=mode)
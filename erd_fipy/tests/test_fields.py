@@ -0,0 +1,45 @@
+"""
+fields.compute_fields caches per-r_m terms; results must follow the values of
+r_m, not the array object passed in.
+"""
+
+import numpy as np
+import pytest
+
+from erd_fipy import fields
+
+
+def _fresh(r_m, sigma_profile=None):
+    """Result with every cache cleared first."""
+    for cache in (fields._weights_cache, fields._Ephi_shape_cache, fields._Bz_decay_cache):
+        cache.clear()
+    return fields.compute_fields(r_m, 1e16, 2.0, sigma_profile=sigma_profile)
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_in_place_change_of_r_m_is_not_served_from_cache(monkeypatch, use_numba):
+    if not use_numba:
+        # Exercise the cached area weights used by the NumPy σ̄ average
+        monkeypatch.setattr(fields, "njit", None)
+    elif fields.njit is None:
+        pytest.skip("Numba is not installed")
+    rr = np.linspace(1e-3, 0.05, 16)
+    sigma = np.linspace(1.0, 5.0, rr.size)
+    expected = _fresh(rr**2, sigma_profile=sigma)
+
+    _fresh(rr, sigma_profile=sigma)
+    rr **= 2  # non-uniform, so the r-weighted σ̄ changes too
+
+    for r_m in (rr, rr.copy()):
+        got = fields.compute_fields(r_m, 1e16, 2.0, sigma_profile=sigma)
+        np.testing.assert_array_equal(got.Ephi_Vpm, expected.Ephi_Vpm)
+        np.testing.assert_array_equal(got.Bz_T, expected.Bz_T)
+
+
+def test_repeated_calls_match_uncached():
+    rr = np.linspace(1e-3, 0.05, 16)
+    fields.compute_fields(rr, 1e16, 2.0)
+    got = fields.compute_fields(rr, 1e16, 2.0)
+    expected = _fresh(rr)
+    np.testing.assert_array_equal(got.Ephi_Vpm, expected.Ephi_Vpm)
+    np.testing.assert_array_equal(got.Bz_T, expected.Bz_T)
@@ -0,0 +1,108 @@
+"""
+H5Writer staging, sizing and layout: every written snapshot must land in its
+row, in order, whatever the buffer size and the n_snapshots hint.
+"""
+
+from types import SimpleNamespace
+
+import h5py
+import numpy as np
+import pytest
+
+from erd_fipy.io import H5Writer, inputs_dtype
+
+NR, NZ = 5, 3
+
+
+def _snapshot(k):
+    """Distinct, reproducible snapshot k (ne/Te as flat r-fastest cell arrays)."""
+    rng = np.random.default_rng(k)
+    inputs = SimpleNamespace(E0_Vpm=100.0 + k, phase_deg=10.0 * k, freq_Hz=13.56e6 + k)
+    return (
+        0.1 * k,
+        rng.uniform(0.0, 1.0, NR),
+        rng.uniform(1e14, 1e17, NZ * NR),
+        rng.uniform(0.5, 5.0, NZ * NR),
+        inputs,
+    )
+
+
+def _write(tmp_path, n_writes, **kwargs):
+    r = np.linspace(0.0, 0.06, NR)
+    z = np.linspace(0.0, 0.1, NZ)
+    writer = H5Writer(str(tmp_path), "run", r, z, **kwargs)
+    for k in range(n_writes):
+        writer.write_snapshot(*_snapshot(k))
+    writer.close()
+    return writer.path
+
+
+def _check(path, n_writes, field_dtype=np.float64):
+    with h5py.File(path, "r") as h:
+        assert h["/time/t"].shape == (n_writes,)
+        assert h["/fields/Bz"].shape == (n_writes, NR)
+        assert h["/fields/ne"].shape == (n_writes, NZ, NR)
+        assert h["/fields/Te"].shape == (n_writes, NZ, NR)
+        assert h["/inputs/log"].shape == (n_writes,)
+        assert h["/fields/ne"].dtype == field_dtype
+        assert h["/fields/Te"].dtype == field_dtype
+        assert h["/inputs/log"].dtype == inputs_dtype
+
+        log = h["/inputs/log"][()]
+        for k in range(n_writes):
+            t, Bz, ne, Te, inputs = _snapshot(k)
+            assert h["/time/t"][k] == t
+            np.testing.assert_array_equal(h["/fields/Bz"][k], Bz)
+            np.testing.assert_array_equal(
+                h["/fields/ne"][k], ne.reshape(NZ, NR).astype(field_dtype)
+            )
+            np.testing.assert_array_equal(
+                h["/fields/Te"][k], Te.reshape(NZ, NR).astype(field_dtype)
+            )
+            assert tuple(log[k]) == (inputs.E0_Vpm, inputs.phase_deg, inputs.freq_Hz)
+
+
+@pytest.mark.parametrize("n_writes", [0, 3, 4, 9])
+def test_flush_across_buffer_boundary(tmp_path, n_writes):
+    # buffer_size=4: partial buffer, exactly full, and two flushes plus a remainder
+    path = _write(tmp_path, n_writes, n_snapshots=n_writes, buffer_size=4)
+    _check(path, n_writes)
+
+
+@pytest.mark.parametrize("n_snapshots", [None, 0, 2, 7, 20])
+def test_n_snapshots_hint_is_trimmed_or_grown(tmp_path, n_snapshots):
+    # fewer (trimmed on close), equal, and more (grown) writes than pre-sized
+    path = _write(tmp_path, 7, n_snapshots=n_snapshots, buffer_size=3)
+    _check(path, 7)
+
+
+def test_f4_field_storage(tmp_path):
+    path = _write(tmp_path, 5, n_snapshots=5, buffer_size=2, field_dtype="f4")
+    _check(path, 5, field_dtype=np.float32)
+    with h5py.File(path, "r") as h:
+        assert h["/fields/Bz"].dtype == np.float64
+        assert h["/time/t"].dtype == np.float64
+
+
+def test_snapshot_arrays_are_copied(tmp_path):
+    r = np.linspace(0.0, 0.06, NR)
+    z = np.linspace(0.0, 0.1, NZ)
+    writer = H5Writer(str(tmp_path), "live", r, z, n_snapshots=2, buffer_size=8)
+    t, Bz, ne, Te, inputs = _snapshot(0)
+    ne_live = ne.copy()
+    writer.write_snapshot(t, Bz, ne_live, Te, inputs)
+    ne_live[:] = -1.0  # the caller keeps stepping the same array
+    writer.close()
+    with h5py.File(writer.path, "r") as h:
+        np.testing.assert_array_equal(h["/fields/ne"][0], ne.reshape(NZ, NR))
+
+
+def test_close_is_idempotent(tmp_path):
+    r = np.linspace(0.0, 0.06, NR)
+    z = np.linspace(0.0, 0.1, NZ)
+    writer = H5Writer(str(tmp_path), "twice", r, z, n_snapshots=4)
+    writer.write_snapshot(*_snapshot(0))
+    writer.close()
+    writer.close()
+    with h5py.File(writer.path, "r") as h:
+        assert h["/time/t"].shape == (1,)